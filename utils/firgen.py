@@ -5,7 +5,6 @@ import numpy as np
 from scipy.io import wavfile
 
 fs = 96000
-filter = firwin(512, 200, 500, fs=fs)
-filter = filter * (1<<15)
-filter = filter.astype(np.int16)
-wavfile.write("filter.wav", fs, filter)
+taps = firwin(512, 200, 500, fs=fs).astype(np.float32)
+taps = np.rint(taps * (1<<15)).astype(np.int16)
+wavfile.write("filter.wav", fs, taps)